@@ -58,7 +58,7 @@ class DEQueue[D]:
             raise TypeError(msg)
 
     def __bool__(self) -> bool:
-        return len(self._ca) > 0
+        return bool(self._ca)
 
     def __len__(self) -> int:
         return len(self._ca)
@@ -86,7 +86,7 @@ class DEQueue[D]:
         return reversed(list(self._ca))
 
     def __repr__(self) -> str:
-        if len(self) == 0:
+        if not self._ca:
             return 'DQ()'
         return 'DQ(' + ', '.join(map(repr, self._ca)) + ')'
 
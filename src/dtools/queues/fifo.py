@@ -55,7 +55,7 @@ class FIFOQueue[D]:
             raise ValueError(msg)
 
     def __bool__(self) -> bool:
-        return len(self._ca) > 0
+        return bool(self._ca)
 
     def __len__(self) -> int:
         return len(self._ca)
@@ -80,7 +80,7 @@ class FIFOQueue[D]:
         return iter(list(self._ca))
 
     def __repr__(self) -> str:
-        if len(self) == 0:
+        if not self._ca:
             return 'FQ()'
         return 'FQ(' + ', '.join(map(repr, self._ca)) + ')'
 
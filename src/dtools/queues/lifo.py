@@ -28,7 +28,6 @@ from collections.abc import Callable, Iterable, Iterator, Sequence
 from typing import Never, overload, TypeVar
 from dtools.circular_array import CA
 from dtools.containers.maybe import MayBe as MB
-from dtools.fp.function import swap
 
 __all__ = ['LIFOQueue', 'lifo_queue']
 
@@ -56,7 +55,7 @@ class LIFOQueue[D]:
             raise TypeError(msg)
 
     def __bool__(self) -> bool:
-        return len(self._ca) > 0
+        return bool(self._ca)
 
     def __len__(self) -> int:
         return len(self._ca)
@@ -81,7 +80,7 @@ class LIFOQueue[D]:
         return reversed(list(self._ca))
 
     def __repr__(self) -> str:
-        if len(self) == 0:
+        if not self._ca:
             return 'LQ()'
         return 'LQ(' + ', '.join(map(repr, self._ca)) + ')'
 
@@ -130,7 +129,8 @@ class LIFOQueue[D]:
         if initial is None:
             if not self._ca:
                 return MB()
-        return MB(self._ca.foldr(swap(f), initial))
+        # reversed copy is deliberate, avoids wrapping f with swap for foldr
+        return MB(CA(reversed(self._ca)).foldl(f, initial))
 
     def map[U](self, f: Callable[[D], U], /) -> LIFOQueue[U]:
         """Map Over the `LIFOQueue`.
@@ -527,6 +527,7 @@ class TestQueueTypes:
         assert dq1.foldr(f1).get(42) == 15
         assert fq1.fold(f1).get(42) == 15
         assert lq1.fold(f1).get(42) == 15
+        assert lq('a', 'b', 'c').fold(lambda a, b: a + b) == MB('cba')
 
         assert dq1.foldl(f1, 10).get(-1) == 25
         assert dq1.foldr(f1, 10).get(-1) == 25